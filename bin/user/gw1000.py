@@ -302,11 +302,9 @@ requires WeeWX and it's dependencies be installed.
     Note: Depending on your system/installation the above command may need to be
           prefixed with sudo.
 
-    Note: The driver must be run under the same Python version as WeeWX uses.
-          For WeeWX 3.x this is Python 2. If WeeWX 4.0.0 or later is installed
-          this may be Python 2 or Python 3. This means that on some systems
-          'python' in the above api_commands may need to be changed to 'python2'
-          or 'python3'.
+    Note: The driver requires Python 3 and must be run under the same Python
+          version as WeeWX uses. This means that on some systems 'python' in
+          the above api_commands may need to be changed to 'python3'.
 
 3.  The --discover command line option is useful for discovering any gateway
 devices on the local network. The IP address and port details returned by
@@ -351,7 +349,6 @@ for more in-depth installation and configuration information.
 # TODO. Revisit debug_wind and debug_rain to see what more debugging output is required
 
 # Refactor TODOS:
-# TODO. self.sensor_ids vs Sensors.sensor_ids
 # TODO. Where should IP address, port and MAC be properties
 
 # Python imports
@@ -362,19 +359,18 @@ from __future__ import print_function
 import calendar
 import configobj
 import json
+import queue
 import re
 import socket
 import struct
 import threading
 import time
+import urllib.request
+from functools import lru_cache
+from io import StringIO
 from operator import itemgetter
-
-# Python 2/3 compatibility shims
-import six
-from six.moves import StringIO
-from six.moves import urllib
-from six.moves.urllib.error import URLError
-from six.moves.urllib.parse import urlencode
+from urllib.error import URLError
+from urllib.parse import urlencode
 
 # WeeWX imports
 import weecfg
@@ -481,6 +477,38 @@ default_lost_contact_log_period = 21600
 default_show_battery = False
 # default firmware update check interval
 default_fw_check_interval = 86400
+
+# Pre-compiled struct.Struct objects for the fixed format binary fields found
+# in device API responses. Compiling each format once at import saves the
+# format string being re-parsed every time a field is decoded.
+# signed byte
+_BYTE = struct.Struct('b')
+# big endian signed short (two byte) integer
+_SHORT = struct.Struct('>h')
+# big endian unsigned short (two byte) integer
+_USHORT = struct.Struct('>H')
+# big endian signed long (four byte) integer
+_LONG = struct.Struct('>l')
+# big endian unsigned long (four byte) integer
+_ULONG = struct.Struct('>L')
+# channel byte followed by signed byte humidity and temperature offsets, used
+# for multichannel temperature-humidity sensor offset data
+_MULCH_OFFSET = struct.Struct('Bbb')
+# channel byte followed by a big endian signed short offset, used for WN34
+# temperature and PM2.5 sensor offset data
+_CHANNEL_OFFSET = struct.Struct('>Bh')
+# sensor address, four byte sensor ID, battery state and signal level, used
+# for sensor ID data
+_SENSOR_ID = struct.Struct('>c4sBB')
+# six unsigned bytes, used for date-time data
+_DATETIME = struct.Struct('BBBBBB')
+# WH45 sensor data excluding the trailing battery state byte
+_WH45 = struct.Struct('>hBHHHHHH')
+# WH46 sensor data excluding the trailing battery state byte
+_WH46 = struct.Struct('>hBHHHHHHHHHH')
+# ten big endian unsigned short (two byte) integers, used for piezo rain gain
+# data
+_RAIN_GAIN = struct.Struct('>10H')
 # For packet unit conversion to work correctly each possible WeeWX field needs
 # to be assigned to a unit group. This is normally already taken care of for
 # WeeWX fields that are part of the in-use database schema; however, an Ecowitt
@@ -1274,13 +1302,17 @@ class Gateway(object):
             # first make a copy of the field map because we will be iterating
             # over it and changing it
             field_map_copy = dict(field_map)
+            # obtain the set of device fields mapped by the field map
+            # extensions so we can quickly test whether a device field is
+            # mapped by the extensions
+            extension_fields = set(extensions.values())
             # iterate over each key, value pair in the copy of the field map
-            for k, v in six.iteritems(field_map_copy):
+            for k, v in field_map_copy.items():
                 # if the 'value' (ie the device field) is in the field map
                 # extensions we will be mapping that device field elsewhere so
                 # pop that field map entry out of the field map so we don't end
                 # up with multiple mappings for a device field
-                if v in extensions.values():
+                if v in extension_fields:
                     # pop the field map entry
                     _dummy = field_map.pop(k)
             # now we can update the field map with the extensions
@@ -1292,7 +1324,7 @@ class Gateway(object):
         # initialise the key that maps 'datetime'
         d_key = None
         # iterate over the field map entries
-        for k, v in six.iteritems(field_map):
+        for k, v in field_map.items():
             # if the mapping is for 'datetime' save the key and break
             if v == 'datetime':
                 d_key = k
@@ -1317,7 +1349,7 @@ class Gateway(object):
         # parsed device API data uses the METRICWX unit system
         _result = {'usUnits': weewx.METRICWX}
         # iterate over each of the key, value pairs in the field map
-        for weewx_field, data_field in six.iteritems(self.field_map):
+        for weewx_field, data_field in self.field_map.items():
             # if the field to be mapped exists in the data obtain it's
             # value and map it to the packet
             if data_field in data:
@@ -1338,7 +1370,7 @@ class Gateway(object):
         msg_list = []
         # iterate over our rain_field_map keys (the 'WeeWX' fields) and values
         # (the 'device' fields) we are interested in
-        for weewx_field, gw_field in six.iteritems(Gateway.rain_field_map):
+        for weewx_field, gw_field in Gateway.rain_field_map.items():
             # do we have a 'WeeWX' field of interest
             if weewx_field in data:
                 # we do so add some formatted output to our list
@@ -1371,7 +1403,7 @@ class Gateway(object):
         msg_list = []
         # iterate over our wind_field_map keys (the 'WeeWX' fields) and values
         # (the 'device' fields) we are interested in
-        for weewx_field, gw_field in six.iteritems(Gateway.wind_field_map):
+        for weewx_field, gw_field in Gateway.wind_field_map.items():
             # do we have a 'WeeWX' field of interest
             if weewx_field in data:
                 # we do so add some formatted output to our list
@@ -1700,7 +1732,7 @@ class GatewayService(weewx.engine.StdService, Gateway):
                 # get the next item from the collector queue, but don't dwell
                 # very long
                 queue_data = self.collector.queue.get(True, 0.5)
-            except six.moves.queue.Empty:
+            except queue.Empty:
                 # the queue is now empty, but that may be because we have
                 # already processed any queued data, log if necessary and break
                 # out of the while loop
@@ -1923,7 +1955,7 @@ class GatewayService(weewx.engine.StdService, Gateway):
             loginf("GatewayService: Converted %s data: %s" % (self.collector.device.model,
                                                               natural_sort_dict(converted_data)))
         # now we can freely augment the packet with any of our mapped obs
-        for field, data in six.iteritems(converted_data):
+        for field, data in converted_data.items():
             # Any existing packet fields, whether they contain data or are
             # None, are respected and left alone. Only fields from the
             # converted data that do not already exist in the packet are
@@ -2609,7 +2641,7 @@ class GatewayDriver(weewx.drivers.AbstractDevice, Gateway):
             try:
                 # get any data from the collector queue
                 queue_data = self.collector.queue.get(True, 10)
-            except six.moves.queue.Empty:
+            except queue.Empty:
                 # there was nothing in the queue so continue
                 pass
             else:
@@ -2727,10 +2759,8 @@ class GatewayDriver(weewx.drivers.AbstractDevice, Gateway):
                     if e:
                         # is it a GWIOError
                         if isinstance(e, GWIOError):
-                            # it is so we raise a WeewxIOError, ideally would
-                            # use raise .. from .. but raise.. from .. is not
-                            # available under Python 2
-                            raise weewx.WeeWxIOError(e)
+                            # it is so we raise a WeewxIOError
+                            raise weewx.WeeWxIOError(e) from e
                         else:
                             # it's not so log it
                             logerr('GatewayDriver: Caught unexpected exception %s: %s' % (e.__class__.__name__,
@@ -2808,7 +2838,7 @@ class Collector(object):
 
     def __init__(self):
         # creat a queue object for passing data back to the driver/service
-        self.queue = six.moves.queue.Queue()
+        self.queue = queue.Queue()
 
     def startup(self):
         pass
@@ -3272,6 +3302,30 @@ class ApiParser(object):
     def __init__(self, log_unknown_fields=True):
         # do we log unknown fields at info or leave at debug
         self.log_unknown_fields = log_unknown_fields
+        # build integer address indexed decode tables for our addressed data
+        # structures so parse_addressed_data() does not need to hash a one
+        # byte bytestring and look up the decode function by name for every
+        # field
+        self.live_data_table = self.build_decode_table(self.live_data_struct)
+        self.rain_data_table = self.build_decode_table(self.rain_data_struct)
+
+    def build_decode_table(self, structure):
+        """Build a decode table from an addressed data structure.
+
+        structure: dict keyed by data element address (one byte bytestring)
+                   and containing the decode function name, field size and
+                   field name for each data element
+
+        Returns a 256 element list indexed by integer data element address.
+        Each element is a tuple consisting of the bound decode function,
+        field size and field name or None if the data element address is
+        unknown.
+        """
+
+        table = [None] * 256
+        for address, (decode_fn_str, field_size, field) in structure.items():
+            table[ord(address)] = (getattr(self, decode_fn_str), field_size, field)
+        return table
 
     def parse_addressed_data(self, payload, structure):
         """Parse an address structure API response payload.
@@ -3285,8 +3339,9 @@ class ApiParser(object):
         element may consist of one or mor bytes.
 
         payload:   API response payload to be parsed, bytestring
-        structure: dict keyed by data element address and containing the
-                   decode function, field size and the field name to be
+        structure: decode table as produced by build_decode_table(), a list
+                   indexed by integer data element address and containing
+                   the decode function, field size and the field name to be
                    used as the key against which the decoded data is to be
                    stored in the result dict
 
@@ -3300,14 +3355,17 @@ class ApiParser(object):
             # we have payload data
             # set a counter to keep track of where we are in the payload
             index = 0
+            # the payload length and our data dict update method do not change
+            # as we work through the payload so look them up once only
+            last_index = len(payload) - 1
+            update_data = data.update
             # work through the payload until we reach the end
-            while index < len(payload) - 1:
+            while index < last_index:
                 # obtain the decode function, field size and field name for
-                # the current field, wrap in a try..except in case we
-                # encounter a field address we do not know about
-                try:
-                    decode_fn_str, field_size, field = structure[payload[index:index + 1]]
-                except KeyError:
+                # the current field, the decode table entry will be None if
+                # we encounter a field address we do not know about
+                decode_entry = structure[payload[index]]
+                if decode_entry is None:
                     # We struck a field 'address' we do not know how to
                     # process. We can't skip to the next field so all we
                     # can really do is accept the data we have so far, log
@@ -3325,20 +3383,23 @@ class ApiParser(object):
                     # data
                     break
                 else:
-                    _field_data = getattr(self, decode_fn_str)(payload[index + 1:index + 1 + field_size],
-                                                               field)
+                    decode_fn, field_size, field = decode_entry
+                    # the field data starts immediately after the address
+                    # byte, the next field starts immediately after the field
+                    # data
+                    start = index + 1
+                    index = start + field_size
+                    _field_data = decode_fn(payload[start:index], field)
                     # do we have any decoded data?
                     if _field_data is not None:
                         # we have decoded data so add the decoded data to
                         # our data dict
-                        data.update(_field_data)
+                        update_data(_field_data)
                     else:
                         # we received None from the decode function, this
                         # usually indicates a field marked as 'reserved' in
                         # the API documentation
                         pass
-                    # we are finished with this field, move onto the next
-                    index += field_size + 1
         return data
 
     def parse_livedata(self, response):
@@ -3370,12 +3431,12 @@ class ApiParser(object):
         """
 
         # obtain the payload size, it's a big endian short (two byte) integer
-        payload_size = struct.unpack(">H", response[3:5])[0]
+        payload_size = _USHORT.unpack_from(response, 3)[0]
         # obtain the payload
         payload = response[5:5 + payload_size - 4]
         # this is addressed data, so we can call parse_addressed_data() and
         # return the result
-        return self.parse_addressed_data(payload, self.live_data_struct)
+        return self.parse_addressed_data(payload, self.live_data_table)
 
     def parse_read_rain(self, response):
         """Parse data from a CMD_READ_RAIN API response.
@@ -3406,12 +3467,12 @@ class ApiParser(object):
         """
 
         # obtain the payload size, it's a big endian short (two byte) integer
-        payload_size = struct.unpack(">H", response[3:5])[0]
+        payload_size = _USHORT.unpack_from(response, 3)[0]
         # obtain the payload
         payload = response[5:5 + payload_size - 4]
         # this is addressed data, so we can call parse_addressed_data() and
         # return the result
-        return self.parse_addressed_data(payload, self.rain_data_struct)
+        return self.parse_addressed_data(payload, self.rain_data_table)
 
     def parse_read_raindata(self, response):
         """Parse data from a CMD_READ_RAINDATA API response.
@@ -3437,7 +3498,7 @@ class ApiParser(object):
         """
 
         # determine the size of the rain data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our parsed data
@@ -3477,30 +3538,13 @@ class ApiParser(object):
         """
 
         # determine the size of the mulch offset data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
-        # initialise a counter
-        index = 0
-        # initialise a dict to hold our parsed data
-        offset_dict = {}
-        # iterate over the data
-        while index < len(data):
-            try:
-                channel = six.byte2int(data[index])
-            except TypeError:
-                channel = data[index]
-            offset_dict[channel] = {}
-            try:
-                offset_dict[channel]['hum'] = struct.unpack("b", data[index + 1])[0]
-            except TypeError:
-                offset_dict[channel]['hum'] = struct.unpack("b", six.int2byte(data[index + 1]))[0]
-            try:
-                offset_dict[channel]['temp'] = struct.unpack("b", data[index + 2])[0] / 10.0
-            except TypeError:
-                offset_dict[channel]['temp'] = struct.unpack("b", six.int2byte(data[index + 2]))[0] / 10.0
-            index += 3
-        return offset_dict
+        # decode each three byte channel record in turn and return the parsed
+        # data as a dict keyed by channel
+        return {channel: {'hum': hum, 'temp': temp / 10.0}
+                for channel, hum, temp in _MULCH_OFFSET.iter_unpack(data)}
 
     @staticmethod
     def parse_get_mulch_t_offset(response):
@@ -3527,26 +3571,13 @@ class ApiParser(object):
         """
 
         # obtain the payload size, it's a big endian short (two byte) integer
-        size = struct.unpack(">H", response[3:5])[0]
+        size = _USHORT.unpack_from(response, 3)[0]
         # extract the actual data
         data = response[5:5 + size - 4]
-        # initialise a counter
-        index = 0
-        # initialise a dict to hold our parsed data
-        offset_dict = {}
-        # iterate over the data
-        while index < len(data):
-            try:
-                channel = six.byte2int(data[index])
-            except TypeError:
-                channel = data[index]
-            try:
-                offset_dict[channel] = struct.unpack(">h", data[index + 1:index + 3])[0] / 10.0
-            except TypeError:
-                offset_dict[channel] = struct.unpack(">h", six.int2byte(data[index + 1:index + 3]))[0] / 10.0
-
-            index += 3
-        return offset_dict
+        # decode each three byte channel record in turn and return the parsed
+        # data as a dict keyed by channel
+        return {channel: offset / 10.0
+                for channel, offset in _CHANNEL_OFFSET.iter_unpack(data)}
 
     @staticmethod
     def parse_get_pm25_offset(response):
@@ -3570,22 +3601,13 @@ class ApiParser(object):
         """
 
         # determine the size of the PM2.5 offset data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
-        # initialise a counter
-        index = 0
-        # initialise a dict to hold our parsed data
-        offset_dict = {}
-        # iterate over the data
-        while index < len(data):
-            try:
-                channel = six.byte2int(data[index])
-            except TypeError:
-                channel = data[index]
-            offset_dict[channel] = struct.unpack(">h", data[index + 1:index + 3])[0] / 10.0
-            index += 3
-        return offset_dict
+        # decode each three byte channel record in turn and return the parsed
+        # data as a dict keyed by channel
+        return {channel: offset / 10.0
+                for channel, offset in _CHANNEL_OFFSET.iter_unpack(data)}
 
     @staticmethod
     def parse_get_co2_offset(response):
@@ -3607,18 +3629,18 @@ class ApiParser(object):
         """
 
         # determine the size of the WH45 offset data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our parsed data
         offset_dict = dict()
         # and decode/store the offset data
         # bytes 0 and 1 hold the CO2 offset
-        offset_dict['co2'] = struct.unpack(">h", data[0:2])[0]
+        offset_dict['co2'] = _SHORT.unpack_from(data, 0)[0]
         # bytes 2 and 3 hold the PM2.5 offset
-        offset_dict['pm25'] = struct.unpack(">h", data[2:4])[0] / 10.0
+        offset_dict['pm25'] = _SHORT.unpack_from(data, 2)[0] / 10.0
         # bytes 4 and 5 hold the PM10 offset
-        offset_dict['pm10'] = struct.unpack(">h", data[4:6])[0] / 10.0
+        offset_dict['pm10'] = _SHORT.unpack_from(data, 4)[0] / 10.0
         return offset_dict
 
     @staticmethod
@@ -3646,7 +3668,7 @@ class ApiParser(object):
         """
 
         # determine the size of the calibration data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our parsed data
@@ -3654,10 +3676,10 @@ class ApiParser(object):
         # and decode/store the calibration data
         # bytes 0 and 1 are reserved (lux to solar radiation conversion
         # gain (126.7))
-        gain_dict['uv'] = struct.unpack(">H", data[2:4])[0] / 100.0
-        gain_dict['solar'] = struct.unpack(">H", data[4:6])[0] / 100.0
-        gain_dict['wind'] = struct.unpack(">H", data[6:8])[0] / 100.0
-        gain_dict['rain'] = struct.unpack(">H", data[8:10])[0] / 100.0
+        gain_dict['uv'] = _USHORT.unpack_from(data, 2)[0] / 100.0
+        gain_dict['solar'] = _USHORT.unpack_from(data, 4)[0] / 100.0
+        gain_dict['wind'] = _USHORT.unpack_from(data, 6)[0] / 100.0
+        gain_dict['rain'] = _USHORT.unpack_from(data, 8)[0] / 100.0
         # return the parsed response
         return gain_dict
 
@@ -3687,25 +3709,19 @@ class ApiParser(object):
         """
 
         # determine the size of the calibration data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our parsed data
         cal_dict = dict()
         # and decode/store the offset calibration data
-        cal_dict['intemp'] = struct.unpack(">h", data[0:2])[0] / 10.0
-        try:
-            cal_dict['inhum'] = struct.unpack("b", data[2])[0]
-        except TypeError:
-            cal_dict['inhum'] = struct.unpack("b", six.int2byte(data[2]))[0]
-        cal_dict['abs'] = struct.unpack(">l", data[3:7])[0] / 10.0
-        cal_dict['rel'] = struct.unpack(">l", data[7:11])[0] / 10.0
-        cal_dict['outtemp'] = struct.unpack(">h", data[11:13])[0] / 10.0
-        try:
-            cal_dict['outhum'] = struct.unpack("b", data[13])[0]
-        except TypeError:
-            cal_dict['outhum'] = struct.unpack("b", six.int2byte(data[13]))[0]
-        cal_dict['dir'] = struct.unpack(">h", data[14:16])[0]
+        cal_dict['intemp'] = _SHORT.unpack_from(data, 0)[0] / 10.0
+        cal_dict['inhum'] = _BYTE.unpack_from(data, 2)[0]
+        cal_dict['abs'] = _LONG.unpack_from(data, 3)[0] / 10.0
+        cal_dict['rel'] = _LONG.unpack_from(data, 7)[0] / 10.0
+        cal_dict['outtemp'] = _SHORT.unpack_from(data, 11)[0] / 10.0
+        cal_dict['outhum'] = _BYTE.unpack_from(data, 13)[0]
+        cal_dict['dir'] = _SHORT.unpack_from(data, 14)[0]
         # return the parsed response
         return cal_dict
 
@@ -3735,7 +3751,7 @@ class ApiParser(object):
         """
 
         # determine the size of the calibration data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
@@ -3744,29 +3760,17 @@ class ApiParser(object):
         index = 0
         # iterate over the data
         while index < len(data):
-            try:
-                channel = six.byte2int(data[index])
-            except TypeError:
-                channel = data[index]
+            channel = data[index]
             cal_dict[channel] = {}
-            try:
-                humidity = six.byte2int(data[index + 1])
-            except TypeError:
-                humidity = data[index + 1]
+            humidity = data[index + 1]
             cal_dict[channel]['humidity'] = humidity
-            cal_dict[channel]['ad'] = struct.unpack(">h", data[index + 2:index + 4])[0]
-            try:
-                ad_select = six.byte2int(data[index + 4])
-            except TypeError:
-                ad_select = data[index + 4]
+            cal_dict[channel]['ad'] = _SHORT.unpack_from(data, index + 2)[0]
+            ad_select = data[index + 4]
             # get 'Customize' setting 1 = enable, 0 = customised
             cal_dict[channel]['ad_select'] = ad_select
-            try:
-                min_ad = six.byte2int(data[index + 5])
-            except TypeError:
-                min_ad = data[index + 5]
+            min_ad = data[index + 5]
             cal_dict[channel]['adj_min'] = min_ad
-            cal_dict[channel]['adj_max'] = struct.unpack(">h", data[index + 6:index + 8])[0]
+            cal_dict[channel]['adj_max'] = _SHORT.unpack_from(data, index + 6)[0]
             index += 8
         # return the parsed response
         return cal_dict
@@ -3790,16 +3794,16 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
-        data_dict['frequency'] = six.indexbytes(data, 0)
-        data_dict['sensor_type'] = six.indexbytes(data, 1)
+        data_dict['frequency'] = data[0]
+        data_dict['sensor_type'] = data[1]
         data_dict['utc'] = self.decode_utc(data[2:6])
-        data_dict['timezone_index'] = six.indexbytes(data, 6)
-        data_dict['dst_status'] = six.indexbytes(data, 7) != 0
+        data_dict['timezone_index'] = data[6]
+        data_dict['dst_status'] = data[7] != 0
         # return the parsed response
         return data_dict
 
@@ -3819,12 +3823,12 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
-        data_dict['interval'] = six.indexbytes(data, 0)
+        data_dict['interval'] = data[0]
         # return the parsed response
         return data_dict
 
@@ -3854,15 +3858,15 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
         # obtain the required data from the response decoding any bytestrings
-        id_size = six.indexbytes(data, 0)
+        id_size = data[0]
         data_dict['id'] = data[1:1 + id_size].decode()
-        password_size = six.indexbytes(data, 1 + id_size)
+        password_size = data[1 + id_size]
         data_dict['password'] = data[2 + id_size:2 + id_size + password_size].decode()
         # return the parsed response
         return data_dict
@@ -3897,17 +3901,17 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
         # obtain the required data from the response decoding any bytestrings
-        id_size = six.indexbytes(data, 0)
+        id_size = data[0]
         data_dict['id'] = data[1:1 + id_size].decode()
-        pw_size = six.indexbytes(data, 1 + id_size)
+        pw_size = data[1 + id_size]
         data_dict['password'] = data[2 + id_size:2 + id_size + pw_size].decode()
-        stn_num_size = six.indexbytes(data, 1 + id_size)
+        stn_num_size = data[1 + id_size]
         data_dict['station_num'] = data[3 + id_size + pw_size:3 + id_size + pw_size + stn_num_size].decode()
         # return the parsed response
         return data_dict
@@ -3938,15 +3942,15 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
         # obtain the required data from the response decoding any bytestrings
-        id_size = six.indexbytes(data, 0)
+        id_size = data[0]
         data_dict['id'] = data[1:1 + id_size].decode()
-        key_size = six.indexbytes(data, 1 + id_size)
+        key_size = data[1 + id_size]
         data_dict['key'] = data[2 + id_size:2 + id_size + key_size].decode()
         # return the parsed response
         return data_dict
@@ -3985,32 +3989,32 @@ class ApiParser(object):
         """
 
         # determine the size of the system parameters data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
         # obtain the required data from the response decoding any bytestrings
         index = 0
-        id_size = six.indexbytes(data, index)
+        id_size = data[index]
         index += 1
         data_dict['id'] = data[index:index + id_size].decode()
         index += id_size
-        password_size = six.indexbytes(data, index)
+        password_size = data[index]
         index += 1
         data_dict['password'] = data[index:index + password_size].decode()
         index += password_size
-        server_size = six.indexbytes(data, index)
+        server_size = data[index]
         index += 1
         data_dict['server'] = data[index:index + server_size].decode()
         index += server_size
-        data_dict['port'] = struct.unpack(">h", data[index:index + 2])[0]
+        data_dict['port'] = _SHORT.unpack_from(data, index)[0]
         index += 2
-        data_dict['interval'] = struct.unpack(">h", data[index:index + 2])[0]
+        data_dict['interval'] = _SHORT.unpack_from(data, index)[0]
         index += 2
-        data_dict['type'] = six.indexbytes(data, index)
+        data_dict['type'] = data[index]
         index += 1
-        data_dict['active'] = six.indexbytes(data, index)
+        data_dict['active'] = data[index]
         # return the parsed response
         return data_dict
 
@@ -4038,17 +4042,17 @@ class ApiParser(object):
         """
 
         # determine the size of the user path data
-        size = six.indexbytes(response, 3)
+        size = response[3]
         # extract the actual system parameters data
         data = response[4:4 + size - 3]
         # initialise a dict to hold our final data
         data_dict = dict()
         index = 0
-        ecowitt_size = six.indexbytes(data, index)
+        ecowitt_size = data[index]
         index += 1
         data_dict['ecowitt_path'] = data[index:index + ecowitt_size].decode()
         index += ecowitt_size
-        wu_size = six.indexbytes(data, index)
+        wu_size = data[index]
         index += 1
         data_dict['wu_path'] = data[index:index + wu_size].decode()
         # return the parsed response
@@ -4095,18 +4099,12 @@ class ApiParser(object):
         Returns a unicode string
         """
 
-        # create a format string so the firmware string can be unpacked into
-        # its bytes
-        firmware_format = "B" * len(response)
-        # unpack the firmware response bytestring, we now have a tuple of
-        # integers representing each of the bytes
-        firmware_t = struct.unpack(firmware_format, response)
         # get the length of the firmware string, it is in byte 4
-        str_length = firmware_t[4]
+        str_length = response[4]
         # the firmware string starts at byte 5 and is str_length bytes long,
-        # convert the sequence of bytes to unicode characters and assemble as a
-        # string and return the result
-        return ''.join([chr(x) for x in firmware_t[5:5 + str_length]])
+        # convert each byte to the unicode character with the same ordinal (ie
+        # decode as latin-1) and return the result
+        return response[5:5 + str_length].decode('latin-1')
 
     @staticmethod
     def decode_reserved(data, field='reserved'):
@@ -4130,7 +4128,7 @@ class ApiParser(object):
         """
 
         if len(data) == 2:
-            value = struct.unpack(">h", data)[0] / 10.0
+            value = _SHORT.unpack(data)[0] / 10.0
         else:
             value = None
         if field is not None:
@@ -4149,7 +4147,7 @@ class ApiParser(object):
         """
 
         if len(data) == 1:
-            value = struct.unpack("B", data)[0]
+            value = data[0]
         else:
             value = None
         if field is not None:
@@ -4171,9 +4169,9 @@ class ApiParser(object):
         """
 
         if len(data) == 2:
-            value = struct.unpack(">H", data)[0] / 10.0
+            value = _USHORT.unpack(data)[0] / 10.0
         elif len(data) > 2:
-            value = struct.unpack(">H", data[-2:])[0] / 10.0
+            value = _USHORT.unpack_from(data, len(data) - 2)[0] / 10.0
         else:
             value = None
         if field is not None:
@@ -4192,7 +4190,7 @@ class ApiParser(object):
         """
 
         if len(data) == 2:
-            value = struct.unpack(">H", data)[0]
+            value = _USHORT.unpack(data)[0]
         else:
             value = None
         if field is not None:
@@ -4211,7 +4209,7 @@ class ApiParser(object):
         """
 
         if len(data) == 4:
-            value = struct.unpack(">L", data)[0] / 10.0
+            value = _ULONG.unpack(data)[0] / 10.0
         else:
             value = None
         if field is not None:
@@ -4229,7 +4227,7 @@ class ApiParser(object):
         """
 
         if len(data) == 6:
-            value = struct.unpack("BBBBBB", data)
+            value = _DATETIME.unpack(data)
         else:
             value = None
         if field is not None:
@@ -4248,7 +4246,7 @@ class ApiParser(object):
         """
 
         if len(data) == 1:
-            value = struct.unpack("B", data)[0]
+            value = data[0]
             value = value if value <= 40 else None
         else:
             value = None
@@ -4281,7 +4279,7 @@ class ApiParser(object):
 
         if len(data) == 4:
             # unpack the 4 byte int
-            value = struct.unpack(">L", data)[0]
+            value = _ULONG.unpack(data)[0]
             # when processing the last lightning strike time if the value
             # is 0xFFFFFFFF it means we have never seen a strike so return
             # None
@@ -4303,7 +4301,7 @@ class ApiParser(object):
         """
 
         if len(data) == 4:
-            value = struct.unpack(">L", data)[0]
+            value = _ULONG.unpack(data)[0]
         else:
             value = None
         if field is not None:
@@ -4320,7 +4318,7 @@ class ApiParser(object):
         """
 
         if len(data) == 2:
-            value = struct.unpack(">H", data)[0] / 100.0
+            value = _USHORT.unpack(data)[0] / 100.0
         else:
             value = None
         if field is not None:
@@ -4368,7 +4366,9 @@ class ApiParser(object):
 
         if len(data) == 3 and field is not None:
             results = dict()
-            results[field] = self.decode_temp(data[0:2])
+            # we have already validated the data length so decode the
+            # temperature directly rather than via decode_temp()
+            results[field] = _SHORT.unpack_from(data)[0] / 10.0
             # we could decode the battery voltage but we will be obtaining
             # battery voltage data from the sensor IDs in a later step so
             # we can skip it here
@@ -4401,14 +4401,19 @@ class ApiParser(object):
 
         if len(data) == 16 and fields is not None:
             results = dict()
-            results[fields[0]] = self.decode_temp(data[0:2])
-            results[fields[1]] = self.decode_humid(data[2:3])
-            results[fields[2]] = self.decode_pm10(data[3:5])
-            results[fields[3]] = self.decode_pm10(data[5:7])
-            results[fields[4]] = self.decode_pm25(data[7:9])
-            results[fields[5]] = self.decode_pm25(data[9:11])
-            results[fields[6]] = self.decode_co2(data[11:13])
-            results[fields[7]] = self.decode_co2(data[13:15])
+            # we have already validated the data length so unpack all fields
+            # in a single pass rather than via the individual (length
+            # checking) decode methods
+            (temp, humid, pm10, pm10_24h, pm25, pm25_24h,
+             co2, co2_24h) = _WH45.unpack_from(data)
+            results[fields[0]] = temp / 10.0
+            results[fields[1]] = humid
+            results[fields[2]] = pm10 / 10.0
+            results[fields[3]] = pm10_24h / 10.0
+            results[fields[4]] = pm25 / 10.0
+            results[fields[5]] = pm25_24h / 10.0
+            results[fields[6]] = co2
+            results[fields[7]] = co2_24h
             # we could decode the battery state but we will be obtaining
             # battery state data from the sensor IDs in a later step so
             # we can skip it here
@@ -4446,18 +4451,23 @@ class ApiParser(object):
 
         if len(data) == 24 and fields is not None:
             results = dict()
-            results[fields[0]] = self.decode_temp(data[0:2])
-            results[fields[1]] = self.decode_humid(data[2:3])
-            results[fields[2]] = self.decode_pm10(data[3:5])
-            results[fields[3]] = self.decode_pm10(data[5:7])
-            results[fields[4]] = self.decode_pm25(data[7:9])
-            results[fields[5]] = self.decode_pm25(data[9:11])
-            results[fields[6]] = self.decode_co2(data[11:13])
-            results[fields[7]] = self.decode_co2(data[13:15])
-            results[fields[8]] = self.decode_pm1(data[15:17])
-            results[fields[9]] = self.decode_pm1(data[17:19])
-            results[fields[10]] = self.decode_pm4(data[19:21])
-            results[fields[11]] = self.decode_pm4(data[21:23])
+            # we have already validated the data length so unpack all fields
+            # in a single pass rather than via the individual (length
+            # checking) decode methods
+            (temp, humid, pm10, pm10_24h, pm25, pm25_24h, co2, co2_24h,
+             pm1, pm1_24h, pm4, pm4_24h) = _WH46.unpack_from(data)
+            results[fields[0]] = temp / 10.0
+            results[fields[1]] = humid
+            results[fields[2]] = pm10 / 10.0
+            results[fields[3]] = pm10_24h / 10.0
+            results[fields[4]] = pm25 / 10.0
+            results[fields[5]] = pm25_24h / 10.0
+            results[fields[6]] = co2
+            results[fields[7]] = co2_24h
+            results[fields[8]] = pm1 / 10.0
+            results[fields[9]] = pm1_24h / 10.0
+            results[fields[10]] = pm4 / 10.0
+            results[fields[11]] = pm4_24h / 10.0
             # we could decode the battery state, but we will be obtaining
             # battery state data from the sensor IDs in a later step so
             # we can skip it here
@@ -4490,8 +4500,10 @@ class ApiParser(object):
 
         if len(data) == 20:
             results = dict()
-            for gain in range(10):
-                results['gain%d' % gain] = self.decode_gain_100(data[gain * 2:gain * 2 + 2])
+            # we have already validated the data length so unpack all gains
+            # in a single pass rather than via decode_gain_100()
+            for gain, value in enumerate(_RAIN_GAIN.unpack_from(data)):
+                results['gain%d' % gain] = value / 100.0
             return results
         return {}
 
@@ -4514,9 +4526,9 @@ class ApiParser(object):
 
         if len(data) == 3:
             results = dict()
-            results['day_reset'] = struct.unpack("B", data[0:1])[0]
-            results['week_reset'] = struct.unpack("B", data[1:2])[0]
-            results['annual_reset'] = struct.unpack("B", data[2:3])[0]
+            results['day_reset'] = data[0]
+            results['week_reset'] = data[1]
+            results['annual_reset'] = data[2]
             return results
         return {}
 
@@ -4616,34 +4628,63 @@ class Sensors(object):
     }
     # sensors for which there is no low battery state
     no_low = ['ws80', 'ws85', 'ws90']
-    # Tuple of sensor ID values for sensors that are not registered with
-    # the device. 'fffffffe' means the sensor is disabled, 'ffffffff' means
-    # the sensor is registering.
-    not_registered = ('fffffffe', 'ffffffff')
+    # the method used to obtain battery state descriptive text for each
+    # battery state decode method
+    batt_desc_fns = {'batt_binary': 'batt_binary_desc',
+                     'batt_int': 'batt_int_desc',
+                     'batt_volt': 'batt_volt_desc',
+                     'batt_volt_tenth': 'batt_volt_desc',
+                     'wh40_batt_volt': 'batt_volt_desc'}
+    # descriptive text for each binary battery state
+    batt_binary_descs = {0: 'OK', 1: 'low'}
+    # descriptive text for each integer battery state, any other value is
+    # unknown
+    batt_int_descs = {0: 'low', 1: 'low', 2: 'OK', 3: 'OK', 4: 'OK', 5: 'OK',
+                      6: 'DC'}
+    # Set of sensor ID values for sensors that are not registered with the
+    # device. 'fffffffe' means the sensor is disabled, 'ffffffff' means the
+    # sensor is registering.
+    not_registered = frozenset(('fffffffe', 'ffffffff'))
 
     def __init__(self, sensor_id_data=None, ignore_wh40_batt=True,
                  show_battery=False, debug=DebugOptions({}), use_wh32=True,
                  is_wh24=False, is_wh46=False):
         """Initialise myself"""
 
+        # build lists of sensor name, sensor long name, battery state decode
+        # function and battery state description function indexed by integer
+        # sensor address, this saves hashing a bytestring address and looking
+        # up the decode function by name for every sensor whenever sensor ID
+        # data is parsed. The class sensor_ids dict is shared by all Sensors
+        # instances so it is never modified, any sensor model overrides are
+        # applied to our lists only.
+        self.sensor_names = [None] * 256
+        self.sensor_long_names = [None] * 256
+        self.batt_fns = [None] * 256
+        self.batt_descs = [None] * 256
+        for address, sensor in Sensors.sensor_ids.items():
+            self.sensor_names[ord(address)] = sensor['name']
+            self.sensor_long_names[ord(address)] = sensor['long_name']
+            self.batt_fns[ord(address)] = getattr(self, sensor['batt_fn'])
+            self.batt_descs[ord(address)] = getattr(self, Sensors.batt_desc_fns[sensor['batt_fn']])
         # are we using a WH32 sensor, if so tell our sensor id decoding we have
         # a WH32, otherwise it will default to WH26.
         if use_wh32:
-            # set the WH24 sensor id decode dict entry
-            self.sensor_ids[b'\x05']['name'] = 'wh32'
-            self.sensor_ids[b'\x05']['long_name'] = 'WH32'
+            # set the WH32 sensor name and long name
+            self.sensor_names[0x05] = 'wh32'
+            self.sensor_long_names[0x05] = 'WH32'
         # Tell our sensor id decoding whether we have a WH24 or a WH65. By
         # default, we are coded to use a WH65. Is there a WH24 connected?
         if is_wh24:
-            # set the WH24 sensor id decode dict entry
-            self.sensor_ids[b'\x00']['name'] = 'wh24'
-            self.sensor_ids[b'\x00']['long_name'] = 'WH24'
+            # set the WH24 sensor name and long name
+            self.sensor_names[0x00] = 'wh24'
+            self.sensor_long_names[0x00] = 'WH24'
         # Tell our sensor id decoding whether we have a WH45 or a WH46. By
         # default, we are coded to use a WH45. Is there a WH46 connected?
         if is_wh46:
-            # set the WH sensor id decode dict entry
-            self.sensor_ids[b'\x27']['name'] = 'wh46'
-            self.sensor_ids[b'\x27']['long_name'] = 'WH46'
+            # set the WH46 sensor name and long name
+            self.sensor_names[0x27] = 'wh46'
+            self.sensor_long_names[0x27] = 'WH46'
 
         # do we ignore battery state data from legacy WH40 sensors that do
         # not provide valid battery state data
@@ -4674,46 +4715,36 @@ class Sensors(object):
         if id_data is not None and len(id_data) > 0:
             # determine the size of the sensor id data, it's a big endian
             # short (two byte) integer at bytes 4 and 5
-            data_size = struct.unpack(">H", id_data[3:5])[0]
+            data_size = _USHORT.unpack_from(id_data, 3)[0]
             # extract the actual sensor id data
             data = id_data[5:5 + data_size - 4]
-            # initialise a counter
-            index = 0
-            # iterate over the data
-            while index < len(data):
-                # get the sensor address
-                address = data[index:index + 1]
-                # do we know how to decode this address
-                if address in Sensors.sensor_ids.keys():
-                    # get the sensor ID
-                    sensor_id = bytes_to_hex(data[index + 1: index + 5],
-                                             separator='',
-                                             caps=False)
-                    # get the method to be used to decode the battery state
-                    # data
-                    batt_fn = Sensors.sensor_ids[data[index:index + 1]]['batt_fn']
-                    # get the raw battery state data
-                    batt = six.indexbytes(data, index + 5)
+            # iterate over the data, each sensor entry is seven bytes in
+            # length, any trailing bytes that do not form a whole sensor entry
+            # are ignored
+            whole_entries = data[:len(data) - len(data) % _SENSOR_ID.size]
+            for address, id_bytes, batt, signal in _SENSOR_ID.iter_unpack(whole_entries):
+                # get the method to be used to decode the battery state data,
+                # this will be None if we do not know how to decode this
+                # address
+                batt_fn = self.batt_fns[ord(address)]
+                if batt_fn is not None:
                     # if we are not showing all battery state data then the
                     # battery state for any sensor with signal == 0 must be set
                     # to None, otherwise parse the raw battery state data as
                     # applicable
-                    if not self.show_battery and six.indexbytes(data, index + 6) == 0:
+                    if not self.show_battery and signal == 0:
                         batt_state = None
                     else:
                         # parse the raw battery state data
-                        batt_state = getattr(self, batt_fn)(batt)
+                        batt_state = batt_fn(batt)
                     # now add the sensor to our sensor data dict
-                    self.sensor_data[address] = {'id': sensor_id,
+                    self.sensor_data[address] = {'id': id_bytes.hex(),
                                                  'battery': batt_state,
-                                                 'signal': six.indexbytes(data, index + 6)
+                                                 'signal': signal
                                                  }
                 else:
                     if self.debug.sensors:
                         loginf("Unknown sensor ID '%s'" % bytes_to_hex(address))
-                # each sensor entry is seven bytes in length so skip to the
-                # start of the next sensor
-                index += 7
 
     @property
     def addresses(self):
@@ -4750,7 +4781,7 @@ class Sensors(object):
         # initialise a list to hold our connected sensor addresses
         connected_list = list()
         # iterate over all sensors
-        for address, data in six.iteritems(self.sensor_data):
+        for address, data in self.sensor_data.items():
             # if the sensor ID is neither 'fffffffe' or 'ffffffff' then it
             # must be connected
             if data['id'] not in self.not_registered:
@@ -4805,7 +4836,7 @@ class Sensors(object):
         # iterate over our connected sensors
         for sensor in self.connected_addresses:
             # get the sensor name
-            sensor_name = Sensors.sensor_ids[sensor]['name']
+            sensor_name = self.sensor_names[ord(sensor)]
             # create the sensor battery state field for this sensor
             data[''.join([sensor_name, '_batt'])] = self.battery_state(sensor)
             # create the sensor signal level field for this sensor
@@ -4813,8 +4844,7 @@ class Sensors(object):
         # return our data
         return data
 
-    @staticmethod
-    def batt_state_desc(address, value):
+    def batt_state_desc(self, address, value):
         """Determine the battery state description for a given sensor.
 
         Given a sensor address and battery state value determine
@@ -4831,36 +4861,35 @@ class Sensors(object):
         """
 
         if value is not None:
-            if Sensors.sensor_ids[address].get('name') in Sensors.no_low:
+            if self.sensor_names[ord(address)] in Sensors.no_low:
                 # we have a sensor for which no low battery cut-off
                 # data exists
                 return None
             else:
-                batt_fn = Sensors.sensor_ids[address].get('batt_fn')
-                if batt_fn == 'batt_binary':
-                    if value == 0:
-                        return "OK"
-                    elif value == 1:
-                        return "low"
-                    else:
-                        return 'Unknown'
-                elif batt_fn == 'batt_int':
-                    if value <= 1:
-                        return "low"
-                    elif value == 6:
-                        return "DC"
-                    elif value <= 5:
-                        return "OK"
-                    else:
-                        return 'Unknown'
-                elif batt_fn in ['batt_volt', 'batt_volt_tenth', 'wh40_batt_volt']:
-                    if value <= 1.2:
-                        return "low"
-                    else:
-                        return "OK"
+                # obtain the descriptive text using the battery state
+                # description method applicable to this sensor
+                return self.batt_descs[ord(address)](value)
         else:
             return 'Unknown'
 
+    @staticmethod
+    def batt_binary_desc(value):
+        """Obtain descriptive text for a binary battery state."""
+
+        return Sensors.batt_binary_descs.get(value, 'Unknown')
+
+    @staticmethod
+    def batt_int_desc(value):
+        """Obtain descriptive text for an integer battery state."""
+
+        return Sensors.batt_int_descs.get(value, 'Unknown')
+
+    @staticmethod
+    def batt_volt_desc(value):
+        """Obtain descriptive text for a voltage battery state."""
+
+        return "low" if value <= 1.2 else "OK"
+
     @staticmethod
     def batt_binary(batt):
         """Decode a binary battery state.
@@ -5396,7 +5425,7 @@ class GatewayApi(object):
 
         # obtain the response size, it's a big endian short (two byte)
         # integer
-        resp_size = struct.unpack('>H', raw_data[3:5])[0]
+        resp_size = _USHORT.unpack_from(raw_data, 3)[0]
         # now extract the actual data payload
         data = raw_data[5:resp_size + 2]
         # initialise a dict to hold our result
@@ -5404,21 +5433,13 @@ class GatewayApi(object):
         # extract and decode the MAC address
         data_dict['mac'] = bytes_to_hex(data[0:6], separator=":")
         # extract and decode the IP address
-        data_dict['ip_address'] = '%d.%d.%d.%d' % struct.unpack('>BBBB',
-                                                                data[6:10])
+        data_dict['ip_address'] = '%d.%d.%d.%d' % tuple(data[6:10])
         # extract and decode the port number
-        data_dict['port'] = struct.unpack('>H', data[10: 12])[0]
-        # get the SSID as a bytestring
-        ssid_b = data[13:]
-        # create a format string so the SSID string can be unpacked into its
-        # bytes, remember the length can vary
-        ssid_format = "B" * len(ssid_b)
-        # unpack the SSID bytestring, we now have a tuple of integers
-        # representing each of the bytes
-        ssid_t = struct.unpack(ssid_format, ssid_b)
-        # convert the sequence of bytes to unicode characters and assemble
-        # as a string and return the result
-        data_dict['ssid'] = "".join([chr(x) for x in ssid_t])
+        data_dict['port'] = _USHORT.unpack_from(data, 10)[0]
+        # get the SSID as a bytestring, convert each byte to the unicode
+        # character with the same ordinal (ie decode as latin-1) and save the
+        # resulting string
+        data_dict['ssid'] = data[13:].decode('latin-1')
         # return the result dict
         return data_dict
 
@@ -5964,17 +5985,38 @@ class GatewayApi(object):
         Returns an API command packet as a bytestring.
         """
 
-        # calculate size
+        # obtain the command code
         try:
-            size = len(self.api_commands[cmd]) + 1 + len(payload) + 1
+            cmd_code = self.api_commands[cmd]
         except KeyError:
             raise UnknownApiCommand("Unknown API command '%s'" % (cmd,))
+        # construct the packet, a packet depends only on the command code and
+        # payload so we obtain it from a cache
+        return GatewayApi.cmd_packet(cmd_code, payload)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def cmd_packet(cmd_code, payload):
+        """Construct an API command packet given a command code and payload.
+
+        The constructed packet is cached so that the packets for frequently
+        issued commands are only constructed once. Both cmd_code and payload
+        must be bytestrings (ie hashable).
+
+        cmd_code: The API command code, byte string.
+        payload:  The data to be sent with the API command, byte string.
+
+        Returns an API command packet as a bytestring.
+        """
+
+        # calculate size
+        size = len(cmd_code) + 1 + len(payload) + 1
         # construct the portion of the message for which the checksum is calculated
-        body = b''.join([self.api_commands[cmd], struct.pack('B', size), payload])
+        body = b''.join([cmd_code, struct.pack('B', size), payload])
         # calculate the checksum
-        checksum = self.calc_checksum(body)
+        checksum = GatewayApi.calc_checksum(body)
         # return the constructed message packet
-        return b''.join([self.header, body, struct.pack('B', checksum)])
+        return b''.join([GatewayApi.header, body, struct.pack('B', checksum)])
 
     def send_cmd(self, packet):
         """Send a command to the API and return the response.
@@ -6050,12 +6092,12 @@ class GatewayApi(object):
 
         # first check the checksum is valid
         calc_checksum = self.calc_checksum(response[2:-1])
-        resp_checksum = six.indexbytes(response, -1)
+        resp_checksum = response[-1]
         if calc_checksum == resp_checksum:
             # checksum check passed, now check the response command code by
             # checkin the 3rd byte of the response matches the command code
             # that was issued
-            if six.indexbytes(response, 2) == six.byte2int(cmd_code):
+            if response[2] == cmd_code[0]:
                 # we have a valid command code in the response, so the
                 # response is valid and all we need do is return
                 return
@@ -6064,8 +6106,8 @@ class GatewayApi(object):
                 # this is most likely due to the device not understanding
                 # the command, possibly due to an old or outdated firmware
                 # version. Raise an UnknownApiCommand exception.
-                exp_int = six.byte2int(cmd_code)
-                resp_int = six.indexbytes(response, 2)
+                exp_int = cmd_code[0]
+                resp_int = response[2]
                 _msg = "Unknown command code in API response. " \
                        "Expected '%s' (0x%s), received '%s' (0x%s)." % (exp_int,
                                                                         "{:02X}".format(exp_int),
@@ -6095,14 +6137,9 @@ class GatewayApi(object):
         Returns the checksum as an integer.
         """
 
-        # initialise the checksum to 0
-        checksum = 0
-        # iterate over each byte in the response
-        for b in six.iterbytes(data):
-            # add the byte to the running total
-            checksum += b
-        # we are only interested in the least significant byte
-        return checksum % 256
+        # sum the bytes in the response, we are only interested in the least
+        # significant byte
+        return sum(data) & 0xFF
 
     def rediscover(self):
         """Attempt to rediscover a lost device.
@@ -6252,15 +6289,8 @@ class GatewayHttp(object):
             try:
                 # submit the request and obtain the raw response
                 w = urllib.request.urlopen(req)
-                # Get charset used so we can decode the stream correctly.
-                # Unfortunately, the way to get the charset depends on whether we
-                # are running under python2 or python3. Assume python3, but be
-                # prepared to catch the error if python2.
-                try:
-                    char_set = w.headers.get_content_charset()
-                except AttributeError:
-                    # must be python2
-                    char_set = w.headers.getparam('charset')
+                # get charset used so we can decode the stream correctly
+                char_set = w.headers.get_content_charset()
                 # Now get the response and decode it using the headers character
                 # set. Be prepared for charset==None.
                 if char_set is not None:
@@ -6862,35 +6892,36 @@ def define_units():
     # merge the default unit groups into weewx.units.obs_group_dict, but so we
     # don't undo any user customisation elsewhere only merge those fields that do
     # not already exits in weewx.units.obs_group_dict
-    for obs, group in six.iteritems(default_groups):
+    for obs, group in default_groups.items():
         if obs not in weewx.units.obs_group_dict.keys():
             weewx.units.obs_group_dict[obs] = group
 
 
 
-def natural_sort_keys(source_dict):
-    """Return a naturally sorted list of keys for a dict."""
+# regular expression used to split text into runs of digits and non-digits
+# when naturally sorting, compiled once rather than on each use
+_NATURAL_SORT_RE = re.compile(r'(\d+)')
 
-    def atoi(text):
-        return int(text) if text.isdigit() else text
 
-    def natural_keys(text):
-        """Natural key sort.
+def natural_keys(text):
+    """Natural key sort.
 
-        Allows use of key=natural_keys to sort a list in human order, eg:
-            alist.sort(key=natural_keys)
+    Allows use of key=natural_keys to sort a list in human order, eg:
+        alist.sort(key=natural_keys)
 
-        https://nedbatchelder.com/blog/200712/human_sorting.html (See
-        Toothy's implementation in the comments)
-        """
+    https://nedbatchelder.com/blog/200712/human_sorting.html (See
+    Toothy's implementation in the comments)
+    """
+
+    return [int(c) if c.isdigit() else c for c in _NATURAL_SORT_RE.split(text.lower())]
 
-        return [atoi(c) for c in re.split(r'(\d+)', text.lower())]
 
-    # create a list of keys in the dict
-    keys_list = list(source_dict.keys())
-    # naturally sort the list of keys where, for example, xxxxx16 appears in the
-    # correct order
-    keys_list.sort(key=natural_keys)
+def natural_sort_keys(source_dict):
+    """Return a naturally sorted list of keys for a dict."""
+
+    # naturally sort the keys in the dict where, for example, xxxxx16 appears
+    # in the correct order
+    keys_list = sorted(source_dict, key=natural_keys)
     # return the sorted list
     return keys_list
 
@@ -6912,18 +6943,31 @@ def natural_sort_dict(source_dict):
     return "{%s}" % ", ".join(sorted_dict_fields)
 
 
+# two character hex representations of each possible byte value, used to
+# format separated hex bytes with a table lookup per byte
+_HEX_PAIRS_UPPER = tuple('%02X' % b for b in range(256))
+_HEX_PAIRS_LOWER = tuple('%02x' % b for b in range(256))
+
+
 def bytes_to_hex(iterable, separator=' ', caps=True):
     """Produce a hex string representation of a sequence of bytes."""
 
-    # assume 'iterable' can be iterated by iterbytes and the individual
-    # elements can be formatted with {:02X}
-    format_str = "{:02X}" if caps else "{:02x}"
     try:
-        return separator.join(format_str.format(c) for c in six.iterbytes(iterable))
-    except ValueError:
-        # most likely we are running python3 and iterable is not a bytestring,
-        # try again coercing iterable to a bytestring
-        return separator.join(format_str.format(c) for c in six.iterbytes(six.b(iterable)))
+        if isinstance(iterable, (bytes, bytearray)):
+            # we have a bytestring, look up the hex pair for each byte and
+            # insert the separator between each hex pair
+            hex_pairs = _HEX_PAIRS_UPPER if caps else _HEX_PAIRS_LOWER
+            return separator.join([hex_pairs[b] for b in iterable])
+        # 'iterable' is not a bytestring, so fall back to formatting each
+        # element individually, assume 'iterable' can be iterated and the
+        # individual elements can be formatted with {:02X}
+        format_str = "{:02X}" if caps else "{:02x}"
+        try:
+            return separator.join(format_str.format(c) for c in iterable)
+        except ValueError:
+            # most likely iterable is a str rather than a bytestring, try
+            # again coercing iterable to a bytestring
+            return separator.join(format_str.format(c) for c in iterable.encode('latin-1'))
     except (TypeError, AttributeError):
         # TypeError - 'iterable' is not iterable
         # AttributeError - likely because separator is None
@@ -6936,7 +6980,8 @@ def obfuscate(plain, obf_char='*'):
 
     Obfuscate all but (at most) the last four characters of a string. Always
     reveal no more than 50% of the characters. The obfuscation character
-    defaults to '*' but can be set when the function is called.
+    defaults to '*' but can be set when the function is called, it must be a
+    single character.
     """
 
     if plain is not None and len(plain) > 0:
@@ -6947,9 +6992,9 @@ def obfuscate(plain, obf_char='*'):
         stem = 1 if len(plain) < 4 else stem
         stem = 0 if len(plain) < 3 else stem
         if stem > 0:
-            # we are retaining some characters so do a little string
-            # manipulation
-            obfuscated = obf_char * (len(plain) - stem) + plain[-stem:]
+            # we are retaining some characters so right justify the retained
+            # characters padding with the obfuscation character
+            obfuscated = plain[-stem:].rjust(len(plain), obf_char)
         else:
             # we are obfuscating everything
             obfuscated = obf_char * len(plain)
@@ -8297,7 +8342,7 @@ class DirectGateway(object):
                 print()
                 print("%-10s %s" % ("Sensor", "Status"))
                 # iterate over each sensor for which we have data
-                for address, sensor_data in six.iteritems(sensors.data):
+                for address, sensor_data in sensors.data.items():
                     # the sensor id indicates whether it is disabled, attempting to
                     # register a sensor or already registered
                     if sensor_data['id'] == 'fffffffe':
@@ -8314,7 +8359,7 @@ class DirectGateway(object):
                                                                             sensor_data.get('signal'),
                                                                             battery_str)
                         # print the formatted data
-                    print("%-10s %s" % (Sensors.sensor_ids[address].get('long_name'), state))
+                    print("%-10s %s" % (sensors.sensor_long_names[ord(address)], state))
             elif len(sensors.data) == 0:
                 print()
                 print("Device at %s did not return any sensor data." % (self.ip_address,))
@@ -8401,7 +8446,7 @@ class DirectGateway(object):
             # now build a new data dict with our converted and formatted data
             result = {}
             # iterate over the fields in our original data dict
-            for key, value in six.iteritems(live_sensor_data_dict):
+            for key, value in live_sensor_data_dict.items():
                 # we don't need usUnits in the result so skip it
                 if key == 'usUnits':
                     continue
@@ -8764,10 +8809,10 @@ class DirectGateway(object):
 # The above api_commands will display details of available command line options.
 #
 # Note. Whilst the driver may be run independently of WeeWX the driver still
-# requires WeeWX and it's dependencies be installed. Consequently, if
-# WeeWX 4.0.0 or later is installed the driver must be run under the same
-# Python version as WeeWX uses. This means that on some systems 'python' in the
-# above api_commands may need to be changed to 'python2' or 'python3'.
+# requires WeeWX and it's dependencies be installed. Consequently, the driver
+# must be run under Python 3 and the same Python version as WeeWX uses. This
+# means that on some systems 'python' in the above api_commands may need to be
+# changed to 'python3'.
 
 def main():
     import optparse
@@ -35,10 +35,11 @@ To run the test suite:
     $ PYTHONPATH=$BIN python3 -m user.tests.test_egd [-v]
 """
 # python imports
+import copy
 import socket
-import struct
 import unittest
 
+from functools import lru_cache
 from io import StringIO
 from unittest.mock import patch
 
@@ -275,6 +276,26 @@ class SensorsTestCase(unittest.TestCase):
         self.assertEqual(self.sensors.signal_level(b'\x11'), 0)
         self.assertEqual(self.sensors.signal_level(b'\x1a'), 3)
 
+    def test_sensor_model_overrides(self):
+        """Test sensor model overrides are not shared between Sensors objects."""
+
+        # take a copy of the class sensor_ids dict so we can check it is not
+        # changed
+        sensor_ids = copy.deepcopy(user.gw1000.Sensors.sensor_ids)
+        # get a Sensors object using the WH32, WH24 and WH46 overrides
+        override_sensors = user.gw1000.Sensors(use_wh32=True, is_wh24=True, is_wh46=True)
+        self.assertEqual(override_sensors.sensor_names[0x00], 'wh24')
+        self.assertEqual(override_sensors.sensor_names[0x05], 'wh32')
+        self.assertEqual(override_sensors.sensor_names[0x27], 'wh46')
+        # now get a Sensors object using no overrides, it should report the
+        # default sensor models
+        default_sensors = user.gw1000.Sensors(use_wh32=False)
+        self.assertEqual(default_sensors.sensor_names[0x00], 'wh65')
+        self.assertEqual(default_sensors.sensor_names[0x05], 'wh26')
+        self.assertEqual(default_sensors.sensor_names[0x27], 'wh45')
+        # the class sensor_ids dict should be unchanged
+        self.assertDictEqual(user.gw1000.Sensors.sensor_ids, sensor_ids)
+
     def test_battery_methods(self):
         """Test battery state methods"""
 
@@ -344,6 +365,8 @@ class SensorsTestCase(unittest.TestCase):
 class ParseTestCase(unittest.TestCase):
     """Test the GatewayCollector Parser class."""
 
+    # show the full diff of any large dict comparison failure
+    maxDiff = None
     # decode structure for CMD_GW1000_LIVEDATA
     live_data_struct = {
         b'\x01': ('decode_temp', 2, 'intemp'),
@@ -743,15 +766,14 @@ class ParseTestCase(unittest.TestCase):
                              'data': 'GW2000C_V2.1.4'
                              }
 
-    def setUp(self):
-
-        # get a Parser object
-        self.parser = user.gw1000.ApiParser()
-        self.maxDiff = None
-
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Setup the ParseTestCase to perform its tests."""
 
-        pass
+        # get a Parser object, an ApiParser object holds no state that is
+        # changed by parsing or decoding so one object can be shared by all
+        # tests
+        cls.parser = user.gw1000.ApiParser()
 
     def test_constants(self):
         """Test constants"""
@@ -775,69 +797,32 @@ class ParseTestCase(unittest.TestCase):
         self.assertDictEqual(self.parser.parse_livedata(response=hex_to_bytes(self.response_data)),
                              self.parsed_response)
 
-        # test parse_read_rain() with piezo gauge only
-        self.assertDictEqual(self.parser.parse_read_rain(response=hex_to_bytes(self.read_rain_piezo['response'])),
-                             self.read_rain_piezo['data'])
-
-        # test parse_read_rain() with both traditional and piezo gauges
-        self.assertDictEqual(self.parser.parse_read_rain(response=hex_to_bytes(self.read_rain_both['response'])),
-                             self.read_rain_both['data'])
-
-        # test parse_read_raindata()
-        self.assertDictEqual(self.parser.parse_read_raindata(response=hex_to_bytes(self.read_raindata['response'])),
-                             self.read_raindata['data'])
-
-        # test parse_get_mulch_offset()
-        self.assertDictEqual(self.parser.parse_get_mulch_offset(response=hex_to_bytes(self.get_mulch_offset['response'])),
-                             self.get_mulch_offset['data'])
-
-        # test parse_get_pm25_offset()
-        self.assertDictEqual(self.parser.parse_get_pm25_offset(response=hex_to_bytes(self.get_pm25_offset['response'])),
-                             self.get_pm25_offset['data'])
-
-        # test parse_get_co2_offset()
-        self.assertDictEqual(self.parser.parse_get_co2_offset(response=hex_to_bytes(self.get_co2_offset['response'])),
-                             self.get_co2_offset['data'])
-
-        # test parse_read_gain()
-        self.assertDictEqual(self.parser.parse_read_gain(response=hex_to_bytes(self.read_gain['response'])),
-                             self.read_gain['data'])
-
-        # test parse_read_calibration()
-        self.assertDictEqual(self.parser.parse_read_calibration(response=hex_to_bytes(self.read_calibration['response'])),
-                             self.read_calibration['data'])
-
-        # test parse_get_soilhumiad()
-        self.assertDictEqual(self.parser.parse_get_soilhumiad(response=hex_to_bytes(self.get_soilhumiad['response'])),
-                             self.get_soilhumiad['data'])
-
-        # test read_ssss()
-        self.assertDictEqual(self.parser.parse_read_ssss(response=hex_to_bytes(self.read_ssss['response'])),
-                             self.read_ssss['data'])
-
-        # test parse_read_ecowitt()
-        self.assertDictEqual(self.parser.parse_read_ecowitt(response=hex_to_bytes(self.read_ecowitt['response'])),
-                             self.read_ecowitt['data'])
-
-        # test parse_read_wunderground()
-        self.assertDictEqual(self.parser.parse_read_wunderground(response=hex_to_bytes(self.read_wunderground['response'])),
-                             self.read_wunderground['data'])
-
-        # test parse_read_wow()
-        self.assertDictEqual(self.parser.parse_read_wow(response=hex_to_bytes(self.read_wow['response'])),
-                             self.read_wow['data'])
-
-        # test parse_read_weathercloud()
-        self.assertDictEqual(self.parser.parse_read_weathercloud(response=hex_to_bytes(self.read_weathercloud['response'])),
-                             self.read_weathercloud['data'])
-
-        # test parse_read_customized()
-        self.assertDictEqual(self.parser.parse_read_customized(response=hex_to_bytes(self.read_customized['response'])),
-                             self.read_customized['data'])
-
-        # test parse_read_usr_path()
-        self.assertDictEqual(self.parser.parse_read_usr_path(response=hex_to_bytes(self.read_usr_path['response'])),
-                             self.read_usr_path['data'])
+        # test those parse methods that return a dict of parsed data, each
+        # entry is the parse method name and the name of the test fixture
+        # holding the response and expected parsed data
+        parse_cases = (
+            ('parse_read_rain', 'read_rain_piezo'),
+            ('parse_read_rain', 'read_rain_both'),
+            ('parse_read_raindata', 'read_raindata'),
+            ('parse_get_mulch_offset', 'get_mulch_offset'),
+            ('parse_get_pm25_offset', 'get_pm25_offset'),
+            ('parse_get_co2_offset', 'get_co2_offset'),
+            ('parse_read_gain', 'read_gain'),
+            ('parse_read_calibration', 'read_calibration'),
+            ('parse_get_soilhumiad', 'get_soilhumiad'),
+            ('parse_read_ssss', 'read_ssss'),
+            ('parse_read_ecowitt', 'read_ecowitt'),
+            ('parse_read_wunderground', 'read_wunderground'),
+            ('parse_read_wow', 'read_wow'),
+            ('parse_read_weathercloud', 'read_weathercloud'),
+            ('parse_read_customized', 'read_customized'),
+            ('parse_read_usr_path', 'read_usr_path'),
+        )
+        for parse_fn, fixture_name in parse_cases:
+            fixture = getattr(self, fixture_name)
+            with self.subTest(parse_fn=parse_fn, fixture=fixture_name):
+                self.assertDictEqual(getattr(self.parser, parse_fn)(response=hex_to_bytes(fixture['response'])),
+                                     fixture['data'])
 
         # test parse_read_station_mac()
         self.assertEqual(self.parser.parse_read_station_mac(response=hex_to_bytes(self.read_station_mac['response'])),
@@ -850,255 +835,56 @@ class ParseTestCase(unittest.TestCase):
     def test_decode(self):
         """Test methods used to decode observation byte data"""
 
+        # test those decode methods that decode a single field, each entry
+        # is the decode method name, the name of the test fixture holding the
+        # data and expected decoded value, the number of bytes to use to test
+        # handling of too few bytes and the number of bytes to use to test
+        # handling of too many bytes. A too many bytes value of None indicates
+        # the decode method accepts too many bytes and the fixture 'long' and
+        # 'long_value' entries are to be used instead.
+        decode_cases = (
+            ('decode_temp', 'temp_data', 1, 3),
+            ('decode_humid', 'humid_data', 0, 2),
+            ('decode_press', 'press_data', 1, None),
+            ('decode_dir', 'dir_data', 1, 3),
+            ('decode_big_rain', 'big_rain_data', 1, 5),
+            ('decode_datetime', 'datetime_data', 1, 7),
+            ('decode_distance', 'distance_data', 0, 2),
+            ('decode_utc', 'utc_data', 1, 5),
+            ('decode_count', 'count_data', 1, 5),
+            ('decode_gain_100', 'gain_100_data', 1, 5),
+            ('decode_speed', 'speed_data', 1, None),
+            ('decode_rain', 'rain_data', 1, None),
+            ('decode_rainrate', 'rainrate_data', 1, None),
+            ('decode_light', 'light_data', 1, 5),
+            ('decode_uv', 'uv_data', 1, None),
+            ('decode_uvi', 'uvi_data', 0, 2),
+            ('decode_moist', 'moist_data', 0, 2),
+            ('decode_pm25', 'pm25_data', 1, None),
+            ('decode_leak', 'leak_data', 0, 2),
+            ('decode_pm10', 'pm10_data', 0, None),
+            ('decode_co2', 'co2_data', 0, 3),
+            ('decode_wet', 'wet_data', 0, 2),
+        )
         print()
-        print('   testing ApiParser.decode_temp()...')
-        # test temperature decode (method decode_temp())
-        self.assertEqual(self.parser.decode_temp(hex_to_bytes(self.temp_data['data'])),
-                         self.temp_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_temp(hex_to_bytes(self.temp_data['data']), field='test'),
-                             {'test': self.temp_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_temp(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_temp(hex_to_bytes(xbytes(3))), None)
-
-        print('   testing ApiParser.decode_humid()...')
-        # test humidity decode (method decode_humid())
-        self.assertEqual(self.parser.decode_humid(hex_to_bytes(self.humid_data['data'])),
-                         self.humid_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_humid(hex_to_bytes(self.humid_data['data']), field='test'),
-                             {'test': self.humid_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_humid(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_humid(hex_to_bytes(xbytes(2))), None)
-
-        print('   testing ApiParser.decode_press()...')
-        # test pressure decode (method decode_press())
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.press_data['data'])),
-                         self.press_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_press(hex_to_bytes(self.press_data['data']), field='test'),
-                             {'test': self.press_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.press_data['long'])),
-                         self.press_data['long_value'])
-
-        print('   testing ApiParser.decode_dir()...')
-        # test direction decode (method decode_dir())
-        self.assertEqual(self.parser.decode_dir(hex_to_bytes(self.dir_data['data'])),
-                         self.dir_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_dir(hex_to_bytes(self.dir_data['data']), field='test'),
-                             {'test': self.dir_data['value']})
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_dir(hex_to_bytes(self.dir_data['data']), field='test'),
-                             {'test': self.dir_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_dir(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_dir(hex_to_bytes(xbytes(3))), None)
-
-        print('   testing ApiParser.decode_big_rain()...')
-        # test big rain decode (method decode_big_rain())
-        self.assertEqual(self.parser.decode_big_rain(hex_to_bytes(self.big_rain_data['data'])),
-                         self.big_rain_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_big_rain(hex_to_bytes(self.big_rain_data['data']), field='test'),
-                             {'test': self.big_rain_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_big_rain(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_big_rain(hex_to_bytes(xbytes(5))), None)
-
-        print('   testing ApiParser.decode_datetime()...')
-        # test datetime decode (method decode_datetime())
-        self.assertEqual(self.parser.decode_datetime(hex_to_bytes(self.datetime_data['data'])),
-                         self.datetime_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_datetime(hex_to_bytes(self.datetime_data['data']), field='test'),
-                             {'test': self.datetime_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_datetime(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_datetime(hex_to_bytes(xbytes(7))), None)
-
-        print('   testing ApiParser.decode_distance()...')
-        # test distance decode (method decode_distance())
-        self.assertEqual(self.parser.decode_distance(hex_to_bytes(self.distance_data['data'])),
-                         self.distance_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_distance(hex_to_bytes(self.distance_data['data']), field='test'),
-                             {'test': self.distance_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_distance(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_distance(hex_to_bytes(xbytes(2))), None)
-
-        print('   testing ApiParser.decode_humid()...')
-        # test utc decode (method decode_utc())
-        self.assertEqual(self.parser.decode_utc(hex_to_bytes(self.utc_data['data'])),
-                         self.utc_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_utc(hex_to_bytes(self.utc_data['data']), field='test'),
-                             {'test': self.utc_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_utc(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_utc(hex_to_bytes(xbytes(5))), None)
-
-        print('   testing ApiParser.decode_count()...')
-        # test count decode (method decode_count())
-        self.assertEqual(self.parser.decode_count(hex_to_bytes(self.count_data['data'])),
-                         self.count_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_count(hex_to_bytes(self.count_data['data']), field='test'),
-                             {'test': self.count_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_count(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_count(hex_to_bytes(xbytes(5))), None)
-
-        print('   testing ApiParser.decode_gain_100()...')
-        # test sensor gain decode (method decode_gain_100())
-        self.assertEqual(self.parser.decode_gain_100(hex_to_bytes(self.gain_100_data['data'])),
-                         self.gain_100_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_gain_100(hex_to_bytes(self.gain_100_data['data']), field='test'),
-                             {'test': self.gain_100_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_gain_100(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_gain_100(hex_to_bytes(xbytes(5))), None)
-
-        print('   testing ApiParser.decode_speed()...')
-        # test speed decode (method decode_speed())
-        self.assertEqual(self.parser.decode_speed(hex_to_bytes(self.speed_data['data'])),
-                         self.speed_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_speed(hex_to_bytes(self.speed_data['data']), field='test'),
-                             {'test': self.speed_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_speed(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.speed_data['long'])),
-                         self.speed_data['long_value'])
-
-        print('   testing ApiParser.decode_rain()...')
-        # test rain decode (method decode_rain())
-        self.assertEqual(self.parser.decode_rain(hex_to_bytes(self.rain_data['data'])),
-                         self.rain_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_rain(hex_to_bytes(self.rain_data['data']), field='test'),
-                             {'test': self.rain_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_rain(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.rain_data['long'])),
-                         self.rain_data['long_value'])
-
-        print('   testing ApiParser.decode_rainrate()...')
-        # test rain rate decode (method decode_rainrate())
-        self.assertEqual(self.parser.decode_rainrate(hex_to_bytes(self.rainrate_data['data'])),
-                         self.rainrate_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_rainrate(hex_to_bytes(self.rainrate_data['data']), field='test'),
-                             {'test': self.rainrate_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_rainrate(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.rainrate_data['long'])),
-                         self.rainrate_data['long_value'])
-
-        print('   testing ApiParser.decode_light()...')
-        # test light decode (method decode_light())
-        self.assertEqual(self.parser.decode_light(hex_to_bytes(self.light_data['data'])),
-                         self.light_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_light(hex_to_bytes(self.light_data['data']), field='test'),
-                             {'test': self.light_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_light(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_light(hex_to_bytes(xbytes(5))), None)
-
-        print('   testing ApiParser.decode_uv()...')
-        # test uv decode (method decode_uv())
-        self.assertEqual(self.parser.decode_uv(hex_to_bytes(self.uv_data['data'])),
-                         self.uv_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_uv(hex_to_bytes(self.uv_data['data']), field='test'),
-                             {'test': self.uv_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_uv(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.uv_data['long'])),
-                         self.uv_data['long_value'])
-
-        print('   testing ApiParser.decode_uvi()...')
-        # test uvi decode (method decode_uvi())
-        self.assertEqual(self.parser.decode_uvi(hex_to_bytes(self.uvi_data['data'])),
-                         self.uvi_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_uvi(hex_to_bytes(self.uvi_data['data']), field='test'),
-                             {'test': self.uvi_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_uvi(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_uvi(hex_to_bytes(xbytes(2))), None)
-
-        print('   testing ApiParser.decode_moist()...')
-        # test moisture decode (method decode_moist())
-        self.assertEqual(self.parser.decode_moist(hex_to_bytes(self.moist_data['data'])),
-                         self.moist_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_moist(hex_to_bytes(self.moist_data['data']), field='test'),
-                             {'test': self.moist_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_moist(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_moist(hex_to_bytes(xbytes(2))), None)
-
-        print('   testing ApiParser.decode_pm25()...')
-        # test pm25 decode (method decode_pm25())
-        self.assertEqual(self.parser.decode_pm25(hex_to_bytes(self.pm25_data['data'])),
-                         self.pm25_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_pm25(hex_to_bytes(self.pm25_data['data']), field='test'),
-                             {'test': self.pm25_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_pm25(hex_to_bytes(xbytes(1))), None)
-        self.assertEqual(self.parser.decode_press(hex_to_bytes(self.pm25_data['long'])),
-                         self.pm25_data['long_value'])
-
-        print('   testing ApiParser.decode_leak()...')
-        # test leak decode (method decode_leak())
-        self.assertEqual(self.parser.decode_leak(hex_to_bytes(self.leak_data['data'])),
-                         self.leak_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_leak(hex_to_bytes(self.leak_data['data']), field='test'),
-                             {'test': self.leak_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_leak(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_leak(hex_to_bytes(xbytes(2))), None)
-
-        print('   testing ApiParser.decode_pm10()...')
-        # test pm10 decode (method decode_pm10())
-        self.assertEqual(self.parser.decode_pm10(hex_to_bytes(self.pm10_data['data'])),
-                         self.pm10_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_pm10(hex_to_bytes(self.pm10_data['data']), field='test'),
-                             {'test': self.pm10_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_pm10(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_pm10(hex_to_bytes(self.pm10_data['long'])),
-                         self.pm10_data['long_value'])
-
-        print('   testing ApiParser.decode_co2()...')
-        # test co2 decode (method decode_co2())
-        self.assertEqual(self.parser.decode_co2(hex_to_bytes(self.co2_data['data'])),
-                         self.co2_data['value'])
-        # test decode with field != None
-        self.assertDictEqual(self.parser.decode_co2(hex_to_bytes(self.co2_data['data']), field='test'),
-                             {'test': self.co2_data['value']})
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_co2(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_co2(hex_to_bytes(xbytes(3))), None)
-
-        print('   testing ApiParser.decode_wet()...')
-        # test wetness decode (method decode_wet())
-        self.assertEqual(self.parser.decode_wet(hex_to_bytes(self.wet_data['data'])),
-                         self.wet_data['value'])
-        # test correct handling of too few and too many bytes
-        self.assertEqual(self.parser.decode_wet(hex_to_bytes(xbytes(0))), None)
-        self.assertEqual(self.parser.decode_wet(hex_to_bytes(xbytes(2))), None)
+        for decode_fn_str, fixture_name, too_few, too_many in decode_cases:
+            print('   testing ApiParser.%s()...' % decode_fn_str)
+            decode_fn = getattr(self.parser, decode_fn_str)
+            fixture = getattr(self, fixture_name)
+            with self.subTest(decode_fn=decode_fn_str):
+                # test the decode
+                self.assertEqual(decode_fn(hex_to_bytes(fixture['data'])),
+                                 fixture['value'])
+                # test decode with field != None
+                self.assertDictEqual(decode_fn(hex_to_bytes(fixture['data']), field='test'),
+                                     {'test': fixture['value']})
+                # test correct handling of too few and too many bytes
+                self.assertEqual(decode_fn(hex_to_bytes(xbytes(too_few))), None)
+                if too_many is not None:
+                    self.assertEqual(decode_fn(hex_to_bytes(xbytes(too_many))), None)
+                else:
+                    self.assertEqual(decode_fn(hex_to_bytes(fixture['long'])),
+                                     fixture['long_value'])
 
         print('   testing ApiParser.decode_wn34()...')
         # test wn34 decode (method decode_wn34())
@@ -1223,6 +1009,12 @@ class UtilitiesTestCase(unittest.TestCase):
         # with a separator and lower case
         self.assertEqual(user.gw1000.bytes_to_hex(hex_to_bytes('ff 00 66 b2'), separator=':', caps=False),
                          'ff:00:66:b2')
+        # with no separator
+        self.assertEqual(user.gw1000.bytes_to_hex(hex_to_bytes('ff 00 66 b2'), separator=''),
+                         'FF0066B2')
+        # with no separator and lower case
+        self.assertEqual(user.gw1000.bytes_to_hex(hex_to_bytes('ff 00 66 b2'), separator='', caps=False),
+                         'ff0066b2')
         # and check exceptions raised
         # TypeError
         self.assertEqual(user.gw1000.bytes_to_hex(22), self.bytes_to_hex_fail_str % 22)
@@ -1249,12 +1041,15 @@ class UtilitiesTestCase(unittest.TestCase):
 class ListsAndDictsTestCase(unittest.TestCase):
     """Test case to test list and dict consistency."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        """Setup the ListsAndDictsTestCase to perform its tests."""
 
         # construct the default field map and save for later, note we construct
         # the default field map by passing gw1000.Gateway.construct_field_map
-        # an empty config dict
-        self.default_field_map = user.gw1000.Gateway.construct_field_map({})
+        # an empty config dict, the field map is not changed by any test so it
+        # need only be constructed once
+        cls.default_field_map = user.gw1000.Gateway.construct_field_map({})
 
     def test_dicts(self):
         """Test dicts for consistency"""
@@ -1262,28 +1057,26 @@ class ListsAndDictsTestCase(unittest.TestCase):
         # test that each WeeWX field in the driver default field map is
         # assigned a unit group, either in the gw1000.default_groups or
         # weewx.units.obs_group_dict observation group dictionaries
-        for w_field in self.default_field_map.keys():
-            if w_field not in weewx.units.obs_group_dict.keys():
-                self.assertIn(w_field,
-                              user.gw1000.default_groups.keys(),
-                              msg="A field from the driver default field map is "
-                                  "missing from the default_groups observation group dictionary")
+        missing = set(self.default_field_map) - set(weewx.units.obs_group_dict) - set(user.gw1000.default_groups)
+        self.assertFalse(missing,
+                         msg="Fields from the driver default field map are missing "
+                             "from the default_groups observation group dictionary: %s" % sorted(missing))
 
         # test that each gateway device field in the driver default field map
         # appears in the DirectGateway observation group dictionary
-        for g_field in self.default_field_map.values():
-            self.assertIn(g_field,
-                          user.gw1000.DirectGateway.gw_direct_obs_group_dict.keys(),
-                          msg="A field from the driver default field map is "
-                              "missing from the observation group dictionary")
+        field_map_values = set(self.default_field_map.values())
+        obs_group_keys = set(user.gw1000.DirectGateway.gw_direct_obs_group_dict)
+        missing = field_map_values - obs_group_keys
+        self.assertFalse(missing,
+                         msg="Fields from the driver default field map are "
+                             "missing from the observation group dictionary: %s" % sorted(missing))
 
         # test that each gateway device field entry in the observation group
         # dictionary is included in the driver default field map
-        for g_field in user.gw1000.DirectGateway.gw_direct_obs_group_dict.keys():
-            self.assertIn(g_field,
-                          self.default_field_map.values(),
-                          msg="A key from the observation group dictionary is "
-                              "missing from the driver default field map")
+        missing = obs_group_keys - field_map_values
+        self.assertFalse(missing,
+                         msg="Keys from the observation group dictionary are "
+                             "missing from the driver default field map: %s" % sorted(missing))
 
 
 class StationTestCase(unittest.TestCase):
@@ -1432,12 +1225,13 @@ class StationTestCase(unittest.TestCase):
         # set the port number we will use
         cls.test_port = cls.port if cls.port is not None else StationTestCase.fake_port
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_cmd_vocab(self, mock_get_mac, mock_get_firmware,
-                       mock_get_sys, mock_get_sensor_id):
+                       mock_get_sys, mock_get_sensor_id, mock_get_livedata):
         """Test command dictionaries for completeness.
 
         Tests:
@@ -1455,6 +1249,8 @@ class StationTestCase(unittest.TestCase):
         mock_get_sys.return_value = StationTestCase.mock_system_params
         # get_sensor_id - get sensor IDs (bytestring)
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
         # get our mocked gateway device API object
         gw_device_api = user.gw1000.GatewayApi(ip_address=self.test_ip,
                                                port=self.test_port)
@@ -1464,7 +1260,7 @@ class StationTestCase(unittest.TestCase):
         for cmd, response in self.commands.items():
             # check for inclusion of the command
             self.assertIn(cmd,
-                          gw_device_api.api_commands.keys(),
+                          gw_device_api.api_commands,
                           msg="Command '%s' not found in Station.api_commands" % cmd)
             # check the command code byte is correct
             self.assertEqual(hex_to_bytes(response)[2:3],
@@ -1482,15 +1278,16 @@ class StationTestCase(unittest.TestCase):
         for cmd, code in gw_device_api.api_commands.items():
             # check for inclusion of the command
             self.assertIn(cmd,
-                          self.commands.keys(),
+                          self.commands,
                           msg="Command '%s' is in Station.api_commands but it is not being tested" % cmd)
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_calc_checksum(self, mock_get_mac, mock_get_firmware,
-                           mock_get_system_params, mock_get_sensor_id):
+                           mock_get_system_params, mock_get_sensor_id, mock_get_livedata):
         """Test checksum calculation.
 
         Tests:
@@ -1506,18 +1303,21 @@ class StationTestCase(unittest.TestCase):
         mock_get_system_params.return_value = StationTestCase.mock_system_params
         # get_sensor_id - sensor ID data
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
         # get our mocked gateway device API object
         gw_device_api = user.gw1000.GatewayApi(ip_address=self.test_ip,
                                                port=self.test_port)
         # test checksum calculation
         self.assertEqual(gw_device_api.calc_checksum(b'00112233bbccddee'), 168)
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_build_cmd_packet(self, mock_get_mac, mock_get_firmware,
-                              mock_get_system_params, mock_get_sensor_id):
+                              mock_get_system_params, mock_get_sensor_id, mock_get_livedata):
         """Test construction of an API command packet
 
         Tests:
@@ -1535,6 +1335,8 @@ class StationTestCase(unittest.TestCase):
         mock_get_system_params.return_value = StationTestCase.mock_system_params
         # get_sensor_id - sensor ID data
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
         # get our mocked gateway device API object
         gw_device_api = user.gw1000.GatewayApi(ip_address=self.test_ip,
                                                port=self.test_port)
@@ -1549,12 +1351,13 @@ class StationTestCase(unittest.TestCase):
                           gw_device_api.build_cmd_packet,
                           cmd='UNKNOWN_COMMAND')
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_decode_broadcast_response(self, mock_get_mac, mock_get_firmware,
-                                       mock_get_system_params, mock_get_sensor_id):
+                                       mock_get_system_params, mock_get_sensor_id, mock_get_livedata):
         """Test decoding of a broadcast response
 
         Tests:
@@ -1570,6 +1373,8 @@ class StationTestCase(unittest.TestCase):
         mock_get_system_params.return_value = StationTestCase.mock_system_params
         # get_sensor_id - sensor ID data
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
 
         # get our mocked gateway device API object
         gw_device_api = user.gw1000.GatewayApi(ip_address=self.test_ip,
@@ -1579,12 +1384,13 @@ class StationTestCase(unittest.TestCase):
         # test broadcast response decode
         self.assertEqual(gw_device_api.decode_broadcast_response(data), self.decoded_broadcast_response)
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_api_response_validity_check(self, mock_get_mac, mock_get_firmware,
-                                         mock_get_sys, mock_get_sensor_id):
+                                         mock_get_sys, mock_get_sensor_id, mock_get_livedata):
         """Test validity checking of an API response
 
         Tests:
@@ -1605,6 +1411,8 @@ class StationTestCase(unittest.TestCase):
         mock_get_sys.return_value = StationTestCase.mock_system_params
         # get_sensor_id - get sensor IDs (bytestring)
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
 
         # get our mocked gateway device API object
         gw_device_api = user.gw1000.GatewayApi(ip_address=self.test_ip,
@@ -1629,13 +1437,14 @@ class StationTestCase(unittest.TestCase):
                           response=self.read_fware_resp_unex_cmd_bytes,
                           cmd_code=self.cmd_read_fware_ver)
 
+    @patch.object(user.gw1000.GatewayApi, 'get_livedata')
     @patch.object(user.gw1000.GatewayApi, 'discover')
     @patch.object(user.gw1000.GatewayApi, 'get_sensor_id')
     @patch.object(user.gw1000.GatewayApi, 'get_system_params')
     @patch.object(user.gw1000.GatewayApi, 'get_firmware_version')
     @patch.object(user.gw1000.GatewayApi, 'get_mac_address')
     def test_discovery(self, mock_get_mac, mock_get_firmware,
-                       mock_get_sys, mock_get_sensor_id, mock_discover):
+                       mock_get_sys, mock_get_sensor_id, mock_discover, mock_get_livedata):
         """Test discovery related methods.
 
         Tests:
@@ -1651,6 +1460,8 @@ class StationTestCase(unittest.TestCase):
         mock_get_sys.return_value = StationTestCase.mock_system_params
         # get_sensor_id - get sensor IDs (bytestring)
         mock_get_sensor_id.return_value = None
+        # get_livedata - live data (dict), no PM1 data so no WH46
+        mock_get_livedata.return_value = {}
         # discover() - list of discovered devices (list of dicts)
         mock_discover.return_value = StationTestCase.discover_multi_resp
 
@@ -2126,21 +1937,18 @@ class GatewayServiceTestCase(unittest.TestCase):
             return gateway_service
 
 
+@lru_cache(maxsize=None)
 def hex_to_bytes(hex_string):
     """Takes a string of hex character pairs and returns a string of bytes.
 
     Allows us to specify a byte string in a little more human-readable format.
     Takes a space delimited string of hex pairs and converts to a string of
     bytes. hex_string pairs must be spaced delimited, eg 'AB 2E 3B'.
-
-    If we only ran under python3 we could use bytes.fromhex(), but we need to
-    cater for python2 as well so use struct.pack.
     """
 
-    # first get our hex string as a list of integers
-    dec_list = [int(a, 16) for a in hex_string.split()]
-    # now pack them in a sequence of bytes
-    return struct.pack('B' * len(dec_list), *dec_list)
+    # bytes.fromhex() ignores whitespace between hex pairs so we can pass our
+    # space delimited string straight through
+    return bytes.fromhex(hex_string)
 
 
 def bytes_to_hex(iterable, separator=' ', caps=True):
@@ -2158,6 +1966,7 @@ def bytes_to_hex(iterable, separator=' ', caps=True):
         return "cannot represent '%s' as hexadecimal bytes" % (iterable,)
 
 
+@lru_cache(maxsize=None)
 def xbytes(num, hex_string='00', separator=' '):
     """Construct a string of delimited repeated hex pairs.
 
@@ -53,17 +53,48 @@ Revision History
 
 # python imports
 import configobj
+import re
+import sys
+from io import StringIO
 from setup import ExtensionInstaller
 
-# import StringIO, use six.moves due to python2/python3 differences
-from six.moves import StringIO
-
 # WeeWX imports
 import weewx
 
 
-REQUIRED_WEEWX_VERSION = "3.7.0"
+REQUIRED_WEEWX_VERSION = "4.0.0"
+REQUIRED_PYTHON_VERSION = (3, 7)
 GW1000_VERSION = "0.6.3"
+# regular expression matching the leading digits of a version number component
+VERSION_COMPONENT_RE = re.compile(r'\d+')
+# Sensors for which we require battery state and signal level extractors in
+# the order they are to appear in the [Accumulator] stanza. Each entry is a
+# tuple of sensor name and number of channels, sensors without channels have
+# 0 channels.
+extractor_sensors = (('wh40', 0), ('wh26', 0), ('wh25', 0), ('wh24', 0),
+                     ('wh65', 0), ('wh31', 8), ('wn34', 8), ('wn35', 8),
+                     ('wh41', 4), ('wh45', 0), ('wh46', 0), ('wh51', 16),
+                     ('wh55', 4), ('wh57', 0), ('wh68', 0), ('ws80', 0),
+                     ('ws85', 0), ('ws90', 0))
+
+
+def sensor_extractors(field_type):
+    """Construct the [Accumulator] config for a sensor field type.
+
+    Returns a multiline string containing a 'last' extractor config stanza
+    for the field_type field (eg 'batt' or 'sig') of each sensor, or sensor
+    channel, in extractor_sensors.
+    """
+
+    fields = []
+    for sensor, channels in extractor_sensors:
+        if channels > 0:
+            fields.extend(['%s_ch%d_%s' % (sensor, ch, field_type) for ch in range(1, channels + 1)])
+        else:
+            fields.append('%s_%s' % (sensor, field_type))
+    return ''.join(["    [[%s]]\n        extractor = last\n" % field for field in fields])
+
+
 # define our config as a multiline string so we can preserve comments
 gw1000_config = """
 [GW1000]
@@ -142,257 +173,17 @@ gw1000_config = """
         extractor = last
     [[heap_free]]
         extractor = last
-    [[wh40_batt]]
-        extractor = last
-    [[wh26_batt]]
-        extractor = last
-    [[wh25_batt]]
-        extractor = last
-    [[wh24_batt]]
-        extractor = last
-    [[wh65_batt]]
-        extractor = last
-    [[wh31_ch1_batt]]
-        extractor = last
-    [[wh31_ch2_batt]]
-        extractor = last
-    [[wh31_ch3_batt]]
-        extractor = last
-    [[wh31_ch4_batt]]
-        extractor = last
-    [[wh31_ch5_batt]]
-        extractor = last
-    [[wh31_ch6_batt]]
-        extractor = last
-    [[wh31_ch7_batt]]
-        extractor = last
-    [[wh31_ch8_batt]]
-        extractor = last
-    [[wn34_ch1_batt]]
-        extractor = last
-    [[wn34_ch2_batt]]
-        extractor = last
-    [[wn34_ch3_batt]]
-        extractor = last
-    [[wn34_ch4_batt]]
-        extractor = last
-    [[wn34_ch5_batt]]
-        extractor = last
-    [[wn34_ch6_batt]]
-        extractor = last
-    [[wn34_ch7_batt]]
-        extractor = last
-    [[wn34_ch8_batt]]
-        extractor = last
-    [[wn35_ch1_batt]]
-        extractor = last
-    [[wn35_ch2_batt]]
-        extractor = last
-    [[wn35_ch3_batt]]
-        extractor = last
-    [[wn35_ch4_batt]]
-        extractor = last
-    [[wn35_ch5_batt]]
-        extractor = last
-    [[wn35_ch6_batt]]
-        extractor = last
-    [[wn35_ch7_batt]]
-        extractor = last
-    [[wn35_ch8_batt]]
-        extractor = last
-    [[wh41_ch1_batt]]
-        extractor = last
-    [[wh41_ch2_batt]]
-        extractor = last
-    [[wh41_ch3_batt]]
-        extractor = last
-    [[wh41_ch4_batt]]
-        extractor = last
-    [[wh45_batt]]
-        extractor = last
-    [[wh46_batt]]
-        extractor = last
-    [[wh51_ch1_batt]]
-        extractor = last
-    [[wh51_ch2_batt]]
-        extractor = last
-    [[wh51_ch3_batt]]
-        extractor = last
-    [[wh51_ch4_batt]]
-        extractor = last
-    [[wh51_ch5_batt]]
-        extractor = last
-    [[wh51_ch6_batt]]
-        extractor = last
-    [[wh51_ch7_batt]]
-        extractor = last
-    [[wh51_ch8_batt]]
-        extractor = last
-    [[wh51_ch9_batt]]
-        extractor = last
-    [[wh51_ch10_batt]]
-        extractor = last
-    [[wh51_ch11_batt]]
-        extractor = last
-    [[wh51_ch12_batt]]
-        extractor = last
-    [[wh51_ch13_batt]]
-        extractor = last
-    [[wh51_ch14_batt]]
-        extractor = last
-    [[wh51_ch15_batt]]
-        extractor = last
-    [[wh51_ch16_batt]]
-        extractor = last
-    [[wh55_ch1_batt]]
-        extractor = last
-    [[wh55_ch2_batt]]
-        extractor = last
-    [[wh55_ch3_batt]]
-        extractor = last
-    [[wh55_ch4_batt]]
-        extractor = last
-    [[wh57_batt]]
-        extractor = last
-    [[wh68_batt]]
-        extractor = last
-    [[ws80_batt]]
-        extractor = last
-    [[ws85_batt]]
-        extractor = last
-    [[ws90_batt]]
-        extractor = last
-    [[wh40_sig]]
-        extractor = last
-    [[wh26_sig]]
-        extractor = last
-    [[wh25_sig]]
-        extractor = last
-    [[wh24_sig]]
-        extractor = last
-    [[wh65_sig]]
-        extractor = last
-    [[wh31_ch1_sig]]
-        extractor = last
-    [[wh31_ch2_sig]]
-        extractor = last
-    [[wh31_ch3_sig]]
-        extractor = last
-    [[wh31_ch4_sig]]
-        extractor = last
-    [[wh31_ch5_sig]]
-        extractor = last
-    [[wh31_ch6_sig]]
-        extractor = last
-    [[wh31_ch7_sig]]
-        extractor = last
-    [[wh31_ch8_sig]]
-        extractor = last
-    [[wn34_ch1_sig]]
-        extractor = last
-    [[wn34_ch2_sig]]
-        extractor = last
-    [[wn34_ch3_sig]]
-        extractor = last
-    [[wn34_ch4_sig]]
-        extractor = last
-    [[wn34_ch5_sig]]
-        extractor = last
-    [[wn34_ch6_sig]]
-        extractor = last
-    [[wn34_ch7_sig]]
-        extractor = last
-    [[wn34_ch8_sig]]
-        extractor = last
-    [[wn35_ch1_sig]]
-        extractor = last
-    [[wn35_ch2_sig]]
-        extractor = last
-    [[wn35_ch3_sig]]
-        extractor = last
-    [[wn35_ch4_sig]]
-        extractor = last
-    [[wn35_ch5_sig]]
-        extractor = last
-    [[wn35_ch6_sig]]
-        extractor = last
-    [[wn35_ch7_sig]]
-        extractor = last
-    [[wn35_ch8_sig]]
-        extractor = last
-    [[wh41_ch1_sig]]
-        extractor = last
-    [[wh41_ch2_sig]]
-        extractor = last
-    [[wh41_ch3_sig]]
-        extractor = last
-    [[wh41_ch4_sig]]
-        extractor = last
-    [[wh45_sig]]
-        extractor = last
-    [[wh46_sig]]
-        extractor = last
-    [[wh51_ch1_sig]]
-        extractor = last
-    [[wh51_ch2_sig]]
-        extractor = last
-    [[wh51_ch3_sig]]
-        extractor = last
-    [[wh51_ch4_sig]]
-        extractor = last
-    [[wh51_ch5_sig]]
-        extractor = last
-    [[wh51_ch6_sig]]
-        extractor = last
-    [[wh51_ch7_sig]]
-        extractor = last
-    [[wh51_ch8_sig]]
-        extractor = last
-    [[wh51_ch9_sig]]
-        extractor = last
-    [[wh51_ch10_sig]]
-        extractor = last
-    [[wh51_ch11_sig]]
-        extractor = last
-    [[wh51_ch12_sig]]
-        extractor = last
-    [[wh51_ch13_sig]]
-        extractor = last
-    [[wh51_ch14_sig]]
-        extractor = last
-    [[wh51_ch15_sig]]
-        extractor = last
-    [[wh51_ch16_sig]]
-        extractor = last
-    [[wh55_ch1_sig]]
-        extractor = last
-    [[wh55_ch2_sig]]
-        extractor = last
-    [[wh55_ch3_sig]]
-        extractor = last
-    [[wh55_ch4_sig]]
-        extractor = last
-    [[wh57_sig]]
-        extractor = last
-    [[wh68_sig]]
-        extractor = last
-    [[ws80_sig]]
-        extractor = last
-    [[ws85_sig]]
-        extractor = last
-    [[ws90_sig]]
-        extractor = last
-    # End Ecowitt Gateway driver extractors
+""" + sensor_extractors('batt') + sensor_extractors('sig') + """    # End Ecowitt Gateway driver extractors
 """
 
-# construct our config dict
-gw1000_dict = configobj.ConfigObj(StringIO(gw1000_config))
-
 
 def version_compare(v1, v2):
     """Basic 'distutils' and 'packaging' free version comparison.
 
-    v1 and v2 are WeeWX version numbers in string format.
+    v1 and v2 are WeeWX version numbers in string format. Version number
+    components are compared numerically using the leading digits of each
+    component, so pre-release versions (eg '5.0.0b15') compare on their
+    numeric part only.
 
     Returns:
         0 if v1 and v2 are the same
@@ -401,7 +192,7 @@ def version_compare(v1, v2):
     """
 
     import itertools
-    mash = itertools.zip_longest(v1.split('.'), v2.split('.'), fillvalue='0')
+    mash = itertools.zip_longest(version_tuple(v1), version_tuple(v2), fillvalue=0)
     for x1, x2 in mash:
         if x1 > x2:
             return 1
@@ -410,17 +201,35 @@ def version_compare(v1, v2):
     return 0
 
 
+def version_tuple(v):
+    """Convert a version number string to a tuple of integers."""
+
+    components = []
+    for c in v.split('.'):
+        m = VERSION_COMPONENT_RE.match(c)
+        components.append(int(m.group()) if m else 0)
+    return tuple(components)
+
+
 def loader():
     return Gw1000Installer()
 
 
 class Gw1000Installer(ExtensionInstaller):
     def __init__(self):
+        if sys.version_info[:2] < REQUIRED_PYTHON_VERSION:
+            msg = "%s requires Python %s or greater, found %s" % (''.join(('Ecowitt gateway driver ', GW1000_VERSION)),
+                                                                  '.'.join(str(v) for v in REQUIRED_PYTHON_VERSION),
+                                                                  sys.version.split()[0])
+            raise weewx.UnsupportedFeature(msg)
         if version_compare(weewx.__version__, REQUIRED_WEEWX_VERSION) < 0:
             msg = "%s requires WeeWX %s or greater, found %s" % (''.join(('Ecowitt gateway driver ', GW1000_VERSION)),
                                                                  REQUIRED_WEEWX_VERSION,
                                                                  weewx.__version__)
             raise weewx.UnsupportedFeature(msg)
+        # construct our config dict, we only need to parse our config string
+        # once we know the installer is actually being used
+        gw1000_dict = configobj.ConfigObj(StringIO(gw1000_config))
         super(Gw1000Installer, self).__init__(
             version=GW1000_VERSION,
             name='GW1000',